@@ -5,11 +5,12 @@
 
 // 全局状态
 let appData = {
-    github_trending: {},
+    github_trending: { repos: {}, lists: {} },
     hackernews: [],
     rss_feeds: [],
     updated_at: null,
     currentLang: 'python',
+    currentPeriod: 'daily',
     currentSource: 'all'
 };
 
@@ -31,7 +32,7 @@ async function loadData() {
         const response = await fetch('data/latest.json');
         const data = await response.json();
         
-        appData.github_trending = data.github_trending || {};
+        appData.github_trending = normalizeGitHub(data.github_trending || {});
         appData.hackernews = data.hackernews || [];
         appData.rss_feeds = data.rss_feeds || [];
         appData.updated_at = data.updated_at;
@@ -53,6 +54,22 @@ async function loadData() {
     }
 }
 
+// 兼容旧格式 {language: [repos]}，统一转换为 {repos, lists}
+function normalizeGitHub(trending) {
+    if (trending.repos && trending.lists) {
+        return trending;
+    }
+    
+    const normalized = { repos: {}, lists: { daily: {} } };
+    Object.entries(trending).forEach(([lang, repos]) => {
+        normalized.lists.daily[lang] = repos.map((repo, i) => {
+            normalized.repos[repo.name] = normalized.repos[repo.name] || repo;
+            return { name: repo.name, rank: i + 1, stars_gained: repo.stars_today };
+        });
+    });
+    return normalized;
+}
+
 // 显示加载状态
 function showLoading() {
     const sections = ['github-list', 'hackernews-list', 'rss-list'];
@@ -129,13 +146,21 @@ function setupEventListeners() {
     });
     
     // 语言标签
-    document.querySelectorAll('.tab-btn').forEach(btn => {
+    document.querySelectorAll('#language-tabs .tab-btn').forEach(btn => {
         btn.addEventListener('click', (e) => {
             const lang = e.target.dataset.lang;
             switchLanguage(lang);
         });
     });
     
+    // 时间范围标签
+    document.querySelectorAll('#period-tabs .tab-btn').forEach(btn => {
+        btn.addEventListener('click', (e) => {
+            const since = e.target.dataset.since;
+            switchPeriod(since);
+        });
+    });
+    
     // RSS 来源过滤（使用事件委托）
     document.getElementById('rss-sources').addEventListener('click', (e) => {
         if (e.target.classList.contains('source-btn')) {
@@ -168,7 +193,20 @@ function switchLanguage(lang) {
     appData.currentLang = lang;
     
     // 更新按钮状态
-    document.querySelectorAll('.tab-btn').forEach(btn => {
+    document.querySelectorAll('#language-tabs .tab-btn').forEach(btn => {
+        btn.classList.remove('active');
+    });
+    event.target.classList.add('active');
+    
+    renderGitHub();
+}
+
+// 切换时间范围
+function switchPeriod(since) {
+    appData.currentPeriod = since;
+    
+    // 更新按钮状态
+    document.querySelectorAll('#period-tabs .tab-btn').forEach(btn => {
         btn.classList.remove('active');
     });
     event.target.classList.add('active');
@@ -208,7 +246,14 @@ function renderCurrentView() {
 // 渲染 GitHub Trending
 function renderGitHub() {
     const container = document.getElementById('github-list');
-    const repos = appData.github_trending[appData.currentLang] || [];
+    const { repos: repoTable, lists } = appData.github_trending;
+    const refs = (lists[appData.currentPeriod] || {})[appData.currentLang] || [];
+    const periodLabel = { daily: 'today', weekly: 'this week', monthly: 'this month' }[appData.currentPeriod];
+    
+    // 榜单只保存引用，从共享仓库表中取出完整信息
+    const repos = refs
+        .filter(ref => repoTable[ref.name])
+        .map(ref => ({ ...repoTable[ref.name], stars_gained: ref.stars_gained }));
     
     if (repos.length === 0) {
         container.innerHTML = '<div class="loading">暂无数据</div>';
@@ -225,7 +270,7 @@ function renderGitHub() {
             <p class="card-description">${escapeHtml(repo.description || '暂无描述')}</p>
             <div class="card-meta">
                 <span>⭐ ${repo.stars}</span>
-                <span>📈 ${repo.stars_today} today</span>
+                <span>📈 ${repo.stars_gained} ${periodLabel}</span>
                 ${repo.forks !== '0' ? `<span>🔀 ${repo.forks}</span>` : ''}
                 <span>💻 ${repo.language}</span>
             </div>
@@ -307,8 +352,7 @@ function escapeHtml(text) {
 // 调试函数
 window.debugApp = () => {
     console.log('App Data:', appData);
-    console.log('GitHub Repos:', Object.keys(appData.github_trending).reduce((sum, lang) => 
-        sum + appData.github_trending[lang].length, 0));
+    console.log('GitHub Repos:', Object.keys(appData.github_trending.repos).length);
     console.log('Hacker News:', appData.hackernews.length);
     console.log('RSS Articles:', appData.rss_feeds.length);
 };
@@ -4,9 +4,17 @@ GitHub Trending 爬虫
 """
 import requests
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 import time
 
 
+# GitHub Trending 支持的时间范围
+TRENDING_PERIODS = ('daily', 'weekly', 'monthly')
+
+# "全部语言" 榜单在结果中使用的键名
+ALL_LANGUAGES = 'all'
+
+
 class GitHubTrendingCrawler:
     def __init__(self):
         self.base_url = 'https://github.com/trending'
@@ -132,6 +140,62 @@ class GitHubTrendingCrawler:
             time.sleep(2)
         
         return result
+    
+    def get_trending_matrix(self, languages, periods=TRENDING_PERIODS, include_all=True,
+                            max_workers=4, delay=1, max_repos=25):
+        """
+        按 语言 × 时间范围 矩阵抓取 trending，并归一化为共享的仓库表
+        
+        同一个仓库可能出现在多个榜单中（例如同时上榜 javascript 和 typescript），
+        完整信息只在 repos 中保存一份，榜单中只记录名称、排名和区间内新增 stars。
+        
+        Args:
+            languages: 语言列表
+            periods: 时间范围列表，取值见 TRENDING_PERIODS
+            include_all: 是否额外抓取 "全部语言" 榜单（键名为 'all'）
+            max_workers: 最大并发请求数
+            delay: 每个请求完成后的等待秒数，避免请求过快
+            max_repos: 每个榜单最多返回项目数
+        
+        Returns:
+            dict: {
+                'repos': {name: repo},
+                'lists': {since: {language: [{'name', 'rank', 'stars_gained'}]}}
+            }
+        """
+        list_languages = ([ALL_LANGUAGES] if include_all else []) + list(languages)
+        tasks = [(since, lang) for since in periods for lang in list_languages]
+        
+        def fetch(task):
+            since, lang = task
+            language = '' if lang == ALL_LANGUAGES else lang
+            repos = self.get_trending(language, since, max_repos)
+            time.sleep(delay)
+            return repos
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            results = list(executor.map(fetch, tasks))
+        
+        # 按任务顺序归一化，保证输出顺序稳定
+        repo_table = {}
+        lists = {since: {} for since in periods}
+        for (since, lang), repos in zip(tasks, results):
+            refs = []
+            for rank, repo in enumerate(repos, start=1):
+                record = dict(repo)
+                stars_gained = record.pop('stars_today', '0')
+                repo_table.setdefault(record['name'], record)
+                refs.append({
+                    'name': record['name'],
+                    'rank': rank,
+                    'stars_gained': stars_gained
+                })
+            lists[since][lang] = refs
+        
+        return {
+            'repos': repo_table,
+            'lists': lists
+        }
 
 
 if __name__ == '__main__':
@@ -148,3 +212,8 @@ if __name__ == '__main__':
     languages = ['python', 'javascript', 'go']
     all_trending = crawler.get_multiple_languages(languages)
     print(f"\n📊 总计抓取 {sum(len(repos) for repos in all_trending.values())} 个项目")
+    
+    # 测试矩阵抓取
+    matrix = crawler.get_trending_matrix(languages)
+    list_count = sum(len(lists) for lists in matrix['lists'].values())
+    print(f"\n🧮 {list_count} 个榜单, 去重后 {len(matrix['repos'])} 个项目")
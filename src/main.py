@@ -33,7 +33,12 @@ class TechNewsAggregator:
         print("\n📊 [1/3] GitHub Trending")
         print("-"*60)
         github_languages = ['python', 'javascript', 'go', 'rust', 'java', 'typescript']
-        github_trending = self.github_crawler.get_multiple_languages(github_languages, 'daily')
+        github_trending = self.github_crawler.get_trending_matrix(
+            github_languages,
+            periods=('daily', 'weekly', 'monthly'),
+            include_all=True,
+            max_workers=4
+        )
         
         # 2. 抓取 Hacker News
         print("\n📰 [2/3] Hacker News")
@@ -91,10 +96,10 @@ class TechNewsAggregator:
             'hackernews': hackernews[:20],  # 只保留前20条
             'rss_feeds': rss_articles[:30],  # 只保留前30条
             'statistics': {
-                'github_repos': sum(len(repos) for repos in github_trending.values()),
+                'github_repos': len(github_trending['repos']),
                 'hackernews_stories': len(hackernews),
                 'rss_articles': len(rss_articles),
-                'total': sum(len(repos) for repos in github_trending.values()) + len(hackernews) + len(rss_articles)
+                'total': len(github_trending['repos']) + len(hackernews) + len(rss_articles)
             }
         }
         
@@ -131,10 +136,12 @@ class TechNewsAggregator:
         print("\n📈 统计信息")
         print("-"*60)
         
-        github_total = sum(len(repos) for repos in github_trending.values())
+        # 仓库已去重，同一项目出现在多个榜单中只计一次
+        github_total = len(github_trending['repos'])
         print(f"   GitHub Trending: {github_total} 个项目")
-        for lang, repos in github_trending.items():
-            print(f"      - {lang}: {len(repos)} 个")
+        for since, lists in github_trending['lists'].items():
+            for lang, refs in lists.items():
+                print(f"      - {since}/{lang}: {len(refs)} 个")
         
         print(f"   Hacker News: {len(hackernews)} 条新闻")
         print(f"   RSS Feeds: {len(rss_articles)} 篇文章")